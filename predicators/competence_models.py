@@ -1,7 +1,7 @@
 """Models for estimating and predicting skill competence."""
 import abc
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from typing import Type as TypingType
 
 import numpy as np
@@ -134,6 +134,19 @@ class LatentVariableSkillCompetenceModel(SkillCompetenceModel):
         ]
         # Model that maps number of data to competence.
         self._competence_regressor: Optional[MonotonicBetaRegressor] = None
+        # Number of data collected before each cycle (regressor inputs). Only
+        # changes when a cycle is advanced, so maintain it incrementally.
+        self._num_data_before_cycle = np.zeros((1, 1), dtype=np.float32)
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        # Models pickled before the regressor inputs were maintained
+        # incrementally do not have them, so rebuild them from the history.
+        if "_num_data_before_cycle" not in state:
+            num_data_before_cycle = np.cumsum(
+                [0] + [len(o) for o in self._cycle_observations[:-1]])
+            self._num_data_before_cycle = np.reshape(
+                num_data_before_cycle.astype(np.float32), (-1, 1))
 
     @classmethod
     def get_name(cls) -> str:
@@ -151,12 +164,13 @@ class LatentVariableSkillCompetenceModel(SkillCompetenceModel):
             return min(
                 1.0, current_competence +
                 CFG.skill_competence_initial_prediction_bonus)
-        # Use the regressor to predict future competence.
+        # Use the regressor to predict future competence. Only the means are
+        # needed, so evaluate both inputs at once.
         current_num_data = self._get_current_num_data()
-        current_rv = self._competence_regressor.predict_beta(current_num_data)
         future_num_data = current_num_data + num_additional_data
-        future_rv = self._competence_regressor.predict_beta(future_num_data)
-        gain = future_rv.mean() - current_rv.mean()
+        current_mean, future_mean = self._competence_regressor.predict_means(
+            np.array([current_num_data, future_num_data], dtype=np.float32))
+        gain = future_mean - current_mean
         assert gain >= -1e-6
         return np.clip(self.get_current_competence() + gain, 0.0, 1.0)
 
@@ -177,9 +191,20 @@ class LatentVariableSkillCompetenceModel(SkillCompetenceModel):
     def advance_cycle(self) -> None:
         # Re-learn before advancing the cycle.
         self._run_expectation_maximization()
+        n = self._get_current_num_data()
         super().advance_cycle()
+        new_input = np.array([[n]], dtype=np.float32)
+        self._num_data_before_cycle = np.vstack(
+            [self._num_data_before_cycle, new_input])
 
     def _run_expectation_maximization(self) -> None:
+        # If nothing was observed during this cycle, there is no new data to
+        # learn from, so keep the current regressor (if any). The posterior
+        # for the next cycle is then the same as the current one, which was
+        # never updated from its prior.
+        if not self._cycle_observations[-1]:
+            self._posterior_competences.append(self._posterior_competences[-1])
+            return
         # Re-learn the competence regressor using EM.
         inputs = self._get_regressor_inputs()
         # Warm-start from last inference cycle.
@@ -217,21 +242,23 @@ class LatentVariableSkillCompetenceModel(SkillCompetenceModel):
             self._competence_regressor.predict_beta(n))
 
     def _get_current_num_data(self) -> int:
-        return sum(len(o) for o in self._cycle_observations)
+        num_data_before = int(self._num_data_before_cycle[-1, 0])
+        return num_data_before + len(self._cycle_observations[-1])
 
     def _get_regressor_inputs(self) -> Array:
-        history = self._cycle_observations
-        num_data_after_cycle = list(np.cumsum([len(h) for h in history]))
-        num_data_before_cycle = np.array([0] + num_data_after_cycle[:-1],
-                                         dtype=np.float32)
-        inputs = np.reshape(num_data_before_cycle, (-1, 1))
-        return inputs
+        assert len(self._num_data_before_cycle) == len(
+            self._cycle_observations)
+        return self._num_data_before_cycle
 
     def _run_map_inference(self, betas: List[BetaRV]) -> List[float]:
         """Compute the MAP competences given the input beta priors."""
         assert len(betas) == len(self._cycle_observations)
         map_competences: List[float] = []
         for o, rv in zip(self._cycle_observations, betas):
+            # Cycles without outcomes contribute the prior mean unchanged.
+            if not o:
+                map_competences.append(rv.mean())
+                continue
             alpha, beta = rv.args
             prv = utils.beta_bernoulli_posterior(o, alpha=alpha, beta=beta)
             map_competences.append(prv.mean())
@@ -403,9 +403,18 @@ class BlocksEnv(BaseEnv):
         z1 = state.get(block1, "pose_z")
         x2 = state.get(block2, "pose_x")
         y2 = state.get(block2, "pose_y")
-        z2 = state.get(block2, "pose_z")
-        return np.allclose([x1, y1, z1], [x2, y2, z2 + self._block_size],
-                           atol=self.on_tol)
+        z2 = state.get(block2, "pose_z") + self._block_size
+        # Scalar checks, since this is called for every pair of blocks and
+        # numpy overhead would dominate for three values.
+        return self._allclose_scalar(x1, x2, self.on_tol) and \
+            self._allclose_scalar(y1, y2, self.on_tol) and \
+            self._allclose_scalar(z1, z2, self.on_tol)
+
+    @staticmethod
+    def _allclose_scalar(a: float, b: float, atol: float) -> bool:
+        # Mirrors np.allclose(a, b, atol=atol), including its default
+        # relative tolerance of 1e-5 on abs(b).
+        return abs(a - b) <= atol + 1e-5 * abs(b)
 
     def _OnTable_holds(self, state: State, objects: Sequence[Object]) -> bool:
         block, = objects
@@ -191,8 +191,10 @@ class CoffeeEnv(BaseEnv):
         next_state.set(self._robot, "wrist", wrist)
         next_state.set(self._robot, "fingers", fingers)
         # Get jug state info for later checks.
-        handle_pos = self._get_jug_handle_grasp(state, self._jug)
-        sq_dist_to_handle = np.sum(np.subtract(handle_pos, (x, y, z))**2)
+        handle_x, handle_y, handle_z = self._get_jug_handle_grasp(
+            state, self._jug)
+        sq_dist_to_handle = (handle_x - x)**2 + (handle_y - y)**2 + \
+            (handle_z - z)**2
         jug_rot = state.get(self._jug, "rot")
         # Check if the button should be pressed for the first time.
         machine_was_on = self._MachineOn_holds(state, [self._machine])
@@ -247,7 +249,6 @@ class CoffeeEnv(BaseEnv):
             sq_dist_to_handle < self.grasp_position_tol and \
             abs(jug_rot) < self.pick_jug_rot_tol:
             # Snap to the handle.
-            handle_x, handle_y, handle_z = handle_pos
             next_state.set(self._robot, "x", handle_x)
             next_state.set(self._robot, "y", handle_y)
             next_state.set(self._robot, "z", handle_z)
@@ -540,12 +541,11 @@ class CoffeeEnv(BaseEnv):
         jug, _ = objects
         if self._Holding_holds(state, [self._robot, jug]):
             return False
-        dispense_pos = (self.dispense_area_x, self.dispense_area_y, self.z_lb)
         x = state.get(jug, "x")
         y = state.get(jug, "y")
         z = self._get_jug_z(state, jug)
-        jug_pos = (x, y, z)
-        sq_dist_to_dispense = np.sum(np.subtract(dispense_pos, jug_pos)**2)
+        sq_dist_to_dispense = (self.dispense_area_x - x)**2 + \
+            (self.dispense_area_y - y)**2 + (self.z_lb - z)**2
         return sq_dist_to_dispense < self.dispense_tol
 
     @staticmethod
@@ -566,12 +566,13 @@ class CoffeeEnv(BaseEnv):
         z = state.get(robot, "z")
         jug_x = state.get(jug, "x")
         jug_y = state.get(jug, "y")
-        jug_top = (jug_x, jug_y, self.jug_height)
         # To prevent false positives, if the distance to the handle is less
         # than the distance to the jug top, we are not twisting.
-        handle_pos = self._get_jug_handle_grasp(state, jug)
-        sq_dist_to_handle = np.sum(np.subtract(handle_pos, (x, y, z))**2)
-        sq_dist_to_jug_top = np.sum(np.subtract(jug_top, (x, y, z))**2)
+        handle_x, handle_y, handle_z = self._get_jug_handle_grasp(state, jug)
+        sq_dist_to_handle = (handle_x - x)**2 + (handle_y - y)**2 + \
+            (handle_z - z)**2
+        sq_dist_to_jug_top = (jug_x - x)**2 + (jug_y - y)**2 + \
+            (self.jug_height - z)**2
         if sq_dist_to_handle < sq_dist_to_jug_top:
             return False
         return sq_dist_to_jug_top < self.grasp_position_tol
@@ -613,11 +614,11 @@ class CoffeeEnv(BaseEnv):
     def _PressingButton_holds(self, state: State,
                               objects: Sequence[Object]) -> bool:
         robot, _ = objects
-        button_pos = (self.button_x, self.button_y, self.button_z)
         x = state.get(robot, "x")
         y = state.get(robot, "y")
         z = state.get(robot, "z")
-        sq_dist_to_button = np.sum(np.subtract(button_pos, (x, y, z))**2)
+        sq_dist_to_button = (self.button_x - x)**2 + \
+            (self.button_y - y)**2 + (self.button_z - z)**2
         return sq_dist_to_button < self.button_radius
 
     @staticmethod
@@ -632,9 +633,9 @@ class CoffeeEnv(BaseEnv):
         jug_x = state.get(self._jug, "x")
         jug_y = state.get(self._jug, "y")
         jug_z = state.get(self._robot, "z") - self.jug_handle_height
-        jug_pos = (jug_x, jug_y, jug_z)
-        pour_pos = self._get_pour_position(state, cup)
-        sq_dist_to_pour = np.sum(np.subtract(jug_pos, pour_pos)**2)
+        pour_x, pour_y, pour_z = self._get_pour_position(state, cup)
+        sq_dist_to_pour = (jug_x - pour_x)**2 + (jug_y - pour_y)**2 + \
+            (jug_z - pour_z)**2
         return sq_dist_to_pour < self.pour_pos_tol
 
     @classmethod
@@ -658,12 +659,12 @@ class CoffeeEnv(BaseEnv):
         jug_x = state.get(self._jug, "x")
         jug_y = state.get(self._jug, "y")
         jug_z = self._get_jug_z(state, self._jug)
-        jug_pos = (jug_x, jug_y, jug_z)
         closest_cup = None
         closest_cup_dist = float("inf")
         for cup in state.get_objects(self._cup_type):
-            target = self._get_pour_position(state, cup)
-            sq_dist = np.sum(np.subtract(jug_pos, target)**2)
+            target_x, target_y, target_z = self._get_pour_position(state, cup)
+            sq_dist = (jug_x - target_x)**2 + (jug_y - target_y)**2 + \
+                (jug_z - target_z)**2
             if sq_dist < self.pour_pos_tol and sq_dist < closest_cup_dist:
                 closest_cup = cup
                 closest_cup_dist = sq_dist
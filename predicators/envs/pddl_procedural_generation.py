@@ -1,12 +1,26 @@
 """Procedurally generates PDDL problem strings."""
 
 import functools
-from typing import Collection, Dict, Iterator, List, Optional, Set, Tuple
+import itertools
+from collections import deque
+from typing import Collection, Dict, List, Optional, Set, Tuple
 
 import numpy as np
+from numpy.typing import NDArray
 
 from predicators.structs import PDDLProblemGenerator
 
+
+@functools.lru_cache(maxsize=None)
+def _object_names(prefix: str, num: int, suffix: str = "") -> Tuple[str, ...]:
+    """Object names prefix0suffix, ..., prefix{num-1}suffix.
+
+    Cached because the same names are needed for every generated problem
+    of the same size.
+    """
+    return tuple(f"{prefix}{i}{suffix}" for i in range(num))
+
+
 ################################### Blocks ####################################
 
 
@@ -34,10 +48,14 @@ def _generate_blocks_problems(min_num_blocks: int, max_num_blocks: int,
                               rng: np.random.Generator) -> List[str]:
     assert max_num_blocks_goal <= min_num_blocks
     problems = []
-    for _ in range(num_problems):
-        num_blocks = rng.integers(min_num_blocks, max_num_blocks + 1)
-        num_goal_blocks = rng.integers(min_num_blocks_goal,
-                                       max_num_blocks_goal + 1)
+    all_num_blocks = rng.integers(min_num_blocks,
+                                  max_num_blocks + 1,
+                                  size=num_problems)
+    all_num_goal_blocks = rng.integers(min_num_blocks_goal,
+                                       max_num_blocks_goal + 1,
+                                       size=num_problems)
+    for num_blocks, num_goal_blocks in zip(all_num_blocks,
+                                           all_num_goal_blocks):
         problem = _generate_blocks_problem(num_blocks, num_goal_blocks,
                                            new_pile_prob,
                                            force_goal_not_achieved, rng)
@@ -49,13 +67,11 @@ def _generate_blocks_problem(num_blocks: int, num_goal_blocks: int,
                              new_pile_prob: float,
                              force_goal_not_achieved: bool,
                              rng: np.random.Generator) -> str:
+    # Create blocks.
+    blocks = _object_names("b", num_blocks)
     # Repeat until the goal does not hold in the initial state.
     while True:
-        # Create blocks.
-        blocks = [f"b{i}" for i in range(num_blocks)]
-        goal_block_idxs = rng.choice(num_blocks,
-                                     size=num_goal_blocks,
-                                     replace=False)
+        goal_block_idxs = rng.permutation(num_blocks)[:num_goal_blocks]
         goal_blocks = [blocks[i] for i in goal_block_idxs]
         # Create piles for the initial state and goal.
         piles: List[List[str]] = []
@@ -93,21 +109,17 @@ def _blocks_piles_to_strs(
     if excluded_predicates is None:
         excluded_predicates = set()
 
-    all_strs = set()
+    all_strs: Set[str] = set()
 
     if "handempty" not in excluded_predicates:
         all_strs.add("(handempty)")
-
-    for pile in piles:
-        if "ontable" not in excluded_predicates:
-            all_strs.add(f"(ontable {pile[0]})")
-        if "clear" not in excluded_predicates:
-            all_strs.add(f"(clear {pile[-1]})")
-        if "on" not in excluded_predicates:
-            for i in range(1, len(pile)):
-                top = pile[i]
-                bottom = pile[i - 1]
-                all_strs.add(f"(on {top} {bottom})")
+    if "ontable" not in excluded_predicates:
+        all_strs.update(f"(ontable {pile[0]})" for pile in piles)
+    if "clear" not in excluded_predicates:
+        all_strs.update(f"(clear {pile[-1]})" for pile in piles)
+    if "on" not in excluded_predicates:
+        all_strs.update(f"(on {top} {bottom})" for pile in piles
+                        for bottom, top in zip(pile, pile[1:]))
 
     return all_strs
 
@@ -133,11 +145,17 @@ def _generate_delivery_problems(min_num_locs: int, max_num_locs: int,
                                 num_problems: int,
                                 rng: np.random.Generator) -> List[str]:
     problems = []
-    for _ in range(num_problems):
-        num_locs = rng.integers(min_num_locs, max_num_locs + 1)
-        num_want_locs = rng.integers(min_num_want_locs, max_num_want_locs + 1)
-        num_extra_newspapers = rng.integers(min_num_extra_newspapers,
-                                            max_num_extra_newspapers + 1)
+    all_num_locs = rng.integers(min_num_locs,
+                                max_num_locs + 1,
+                                size=num_problems)
+    all_num_want_locs = rng.integers(min_num_want_locs,
+                                     max_num_want_locs + 1,
+                                     size=num_problems)
+    all_num_extra_newspapers = rng.integers(min_num_extra_newspapers,
+                                            max_num_extra_newspapers + 1,
+                                            size=num_problems)
+    for num_locs, num_want_locs, num_extra_newspapers in zip(
+            all_num_locs, all_num_want_locs, all_num_extra_newspapers):
         num_newspapers = num_want_locs + num_extra_newspapers
         problem = _generate_delivery_problem(num_locs, num_want_locs,
                                              num_newspapers, rng)
@@ -148,32 +166,36 @@ def _generate_delivery_problems(min_num_locs: int, max_num_locs: int,
 def _generate_delivery_problem(num_locs: int, num_want_locs: int,
                                num_newspapers: int,
                                rng: np.random.Generator) -> str:
-    init_strs = set()
+    # Every init atom below is distinct by construction (the home location is
+    # never a target), so collect them in a list and sort once at the end.
+    init_strs: List[str] = []
     goal_strs = set()
 
     # Create locations.
-    locs = [f"loc-{i}" for i in range(num_locs)]
+    locs = _object_names("loc-", num_locs)
     # Randomize the home location.
-    home_loc = locs[rng.choice(num_locs)]
-    possible_targets = [l for l in locs if l != home_loc]
-    target_locs = rng.choice(possible_targets, num_want_locs, replace=False)
+    home_idx = rng.integers(num_locs)
+    # Sample the targets from the other locations by skipping past home.
+    assert num_want_locs < num_locs
+    target_idxs = rng.permutation(num_locs - 1)[:num_want_locs]
+    target_idxs[target_idxs >= home_idx] += 1
     # Add the initial state and goal atoms about the locations.
-    for loc in locs:
-        if loc == home_loc:
-            init_strs.add(f"(isHomeBase {loc})")
-            init_strs.add(f"(at {loc})")
-            init_strs.add(f"(safe {loc})")
-            init_strs.add(f"(satisfied {loc})")
-        if loc in target_locs:
-            init_strs.add(f"(wantsPaper {loc})")
-            init_strs.add(f"(safe {loc})")
-            goal_strs.add(f"(satisfied {loc})")
+    home_loc = locs[home_idx]
+    init_strs.append(f"(isHomeBase {home_loc})")
+    init_strs.append(f"(at {home_loc})")
+    init_strs.append(f"(safe {home_loc})")
+    init_strs.append(f"(satisfied {home_loc})")
+    for target_idx in target_idxs:
+        loc = locs[target_idx]
+        init_strs.append(f"(wantsPaper {loc})")
+        init_strs.append(f"(safe {loc})")
+        goal_strs.add(f"(satisfied {loc})")
 
     # Create papers.
-    papers = [f"paper-{i}" for i in range(num_newspapers)]
+    papers = _object_names("paper-", num_newspapers)
     # Add the initial state atoms about the papers.
     for paper in papers:
-        init_strs.add(f"(unpacked {paper})")
+        init_strs.append(f"(unpacked {paper})")
 
     # Finalize PDDL problem str.
     locs_str = "\n        ".join(locs)
@@ -211,11 +233,15 @@ def _generate_spanner_problems(min_nuts: int, max_nuts: int,
                                min_locs: int, max_locs: int, num_problems: int,
                                rng: np.random.Generator) -> List[str]:
     problems = []
-    for _ in range(num_problems):
-        num_nuts = rng.integers(min_nuts, max_nuts + 1)
-        num_extra_span = rng.integers(min_extra_span, max_extra_span + 1)
+    all_num_nuts = rng.integers(min_nuts, max_nuts + 1, size=num_problems)
+    all_num_extra_span = rng.integers(min_extra_span,
+                                      max_extra_span + 1,
+                                      size=num_problems)
+    all_num_locs = rng.integers(min_locs, max_locs + 1, size=num_problems)
+    for num_nuts, num_extra_span, num_locs in zip(all_num_nuts,
+                                                  all_num_extra_span,
+                                                  all_num_locs):
         num_spanners = num_nuts + num_extra_span
-        num_locs = rng.integers(min_locs, max_locs + 1)
         problem = _generate_spanner_problem(num_nuts, num_spanners, num_locs,
                                             rng)
         problems.append(problem)
@@ -226,25 +252,27 @@ def _generate_spanner_problem(num_nuts: int, num_spanners: int, num_locs: int,
                               rng: np.random.Generator) -> str:
     # Create objects.
     man = "bob"
-    spanners = [f"spanner{i}" for i in range(num_spanners)]
-    nuts = [f"nut{i}" for i in range(num_nuts)]
-    locs = [f"location{i}" for i in range(num_locs)]
+    spanners = _object_names("spanner", num_spanners)
+    nuts = _object_names("nut", num_nuts)
+    locs = _object_names("location", num_locs)
     shed = "shed"
     gate = "gate"
 
     # Create the initial state.
-    init_strs = {f"(at {man} {shed})"}
-    for spanner in spanners:
-        loc = rng.choice(locs)
-        init_strs.add(f"(at {spanner} {loc})")
-        init_strs.add(f"(useable {spanner})")
+    # Every init atom below is distinct by construction, so collect them in a
+    # list and sort once at the end.
+    init_strs = [f"(at {man} {shed})"]
+    spanner_loc_idxs = rng.integers(num_locs, size=num_spanners)
+    init_strs.extend(f"(at {spanner} {locs[loc_idx]})"
+                     for spanner, loc_idx in zip(spanners, spanner_loc_idxs))
+    init_strs.extend(f"(useable {spanner})" for spanner in spanners)
     for nut in nuts:
-        init_strs.add(f"(at {nut} {gate})")
-        init_strs.add(f"(loose {nut})")
-    init_strs.add(f"(link shed {locs[0]})")
-    for i in range(num_locs - 1):
-        init_strs.add(f"(link {locs[i]} {locs[i+1]})")
-    init_strs.add(f"(link {locs[-1]} gate)")
+        init_strs.append(f"(at {nut} {gate})")
+        init_strs.append(f"(loose {nut})")
+    # Link the locations in a chain from the shed to the gate.
+    chain = (shed, ) + locs + (gate, )
+    init_strs.extend(f"(link {loc} {next_loc})"
+                     for loc, next_loc in zip(chain, chain[1:]))
 
     # Create the goal.
     goal_strs = {f"(tightened {nut})" for nut in nuts}
@@ -253,7 +281,7 @@ def _generate_spanner_problem(num_nuts: int, num_spanners: int, num_locs: int,
     man_str = "\n        ".join([man])
     spanner_str = "\n        ".join(spanners)
     nuts_str = "\n        ".join(nuts)
-    locs_str = "\n        ".join([shed, gate] + locs)
+    locs_str = "\n        ".join((shed, gate) + locs)
     init_str = " ".join(sorted(init_strs))
     goal_str = " ".join(sorted(goal_strs))
     problem_str = f"""(define (problem spanner-procgen)
@@ -275,6 +303,9 @@ def _generate_spanner_problem(num_nuts: int, num_spanners: int, num_locs: int,
 
 FOREST_I, FOREST_G, FOREST_W, FOREST_P, FOREST_X, FOREST_H = range(6)
 
+# Steps between adjacent grid cells.
+_GRID_DELTAS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
 
 def create_forest_pddl_generator(min_size: int,
                                  max_size: int) -> PDDLProblemGenerator:
@@ -285,16 +316,22 @@ def create_forest_pddl_generator(min_size: int,
 def _generate_forest_problems(min_size: int, max_size: int, num_problems: int,
                               rng: np.random.Generator) -> List[str]:
     problems = []
-    for _ in range(num_problems):
-        height = rng.integers(min_size, max_size + 1)
-        width = rng.integers(min_size, max_size + 1)
+    heights = rng.integers(min_size, max_size + 1, size=num_problems)
+    widths = rng.integers(min_size, max_size + 1, size=num_problems)
+    for height, width in zip(heights, widths):
         problem = _generate_forest_problem(height, width, rng)
         problems.append(problem)
     return problems
 
 
-def _generate_random_forest_grid(grid_height: int, grid_width: int,
-                                 rng: np.random.Generator) -> List[List[int]]:
+def _generate_random_forest_grid(
+    grid_height: int, grid_width: int, rng: np.random.Generator
+) -> Tuple[NDArray[np.int64], List[Tuple[int, int]]]:
+    """Returns the grid and the trail from the initial location to the goal.
+
+    Cells off the trail are never hills or paths, and the trail never
+    touches itself, so the trail is the only such route in the grid.
+    """
 
     I_row = rng.integers(0, grid_height)
     I_col = rng.integers(0, grid_width)
@@ -305,94 +342,113 @@ def _generate_random_forest_grid(grid_height: int, grid_width: int,
         if (G_row, G_col) != (I_row, I_col):
             break
 
-    random_path = _random_grid_walk((I_row, I_col), (G_row, G_col), set(),
-                                    grid_height, grid_width, None, rng)
+    random_path = _random_grid_walk((I_row, I_col), (G_row, G_col),
+                                    grid_height, grid_width, rng)
     assert random_path
 
-    remaining_coords = {(r, c)
-                        for r in range(grid_height)
-                        for c in range(grid_width)} - set(random_path)
+    grid = np.full((grid_height, grid_width), -1, dtype=np.int64)
 
-    grid = [[-1 for c in range(grid_width)] for r in range(grid_height)]
-
-    for non_path_coord in remaining_coords:
-        loc_prob = rng.uniform()
-        if loc_prob <= 0.5:
-            grid[non_path_coord[0]][non_path_coord[1]] = FOREST_X
-        else:
-            grid[non_path_coord[0]][non_path_coord[1]] = FOREST_W
+    # Cells off the path are trees or water with equal probability. These are
+    # drawn for all cells at once, in row-major order.
+    path_rows, path_cols = np.array(random_path).T
+    off_path = np.ones((grid_height, grid_width), dtype=bool)
+    off_path[path_rows, path_cols] = False
+    off_path_probs = rng.uniform(size=np.count_nonzero(off_path))
+    grid[off_path] = np.where(off_path_probs <= 0.5, FOREST_X, FOREST_W)
 
+    # Cells on the path depend on whether the previous cell was a hill, so
+    # they are labeled in order, with the probabilities drawn up front.
+    path_probs = rng.uniform(size=len(random_path))
     last_was_hill = False
-    for i, path_coord in enumerate(random_path):
-        loc_prob = rng.uniform()
+    for i, (path_coord, loc_prob) in enumerate(zip(random_path, path_probs)):
         if path_coord == (I_row, I_col):
-            grid[path_coord[0]][path_coord[1]] = FOREST_I
+            grid[path_coord] = FOREST_I
         elif path_coord == (G_row, G_col):
-            grid[path_coord[0]][path_coord[1]] = FOREST_G
+            grid[path_coord] = FOREST_G
         elif i > 1 and not last_was_hill and loc_prob <= 0.2:
-            grid[path_coord[0]][path_coord[1]] = FOREST_H
+            grid[path_coord] = FOREST_H
             last_was_hill = True
         else:
-            grid[path_coord[0]][path_coord[1]] = FOREST_P
+            grid[path_coord] = FOREST_P
 
-    for r in range(grid_height):
-        for c in range(grid_width):
-            assert grid[r][c] != -1
+    assert (grid != -1).all()
 
-    return grid
+    return grid, random_path
 
 
 def _random_grid_walk(
-        curr_coords: Tuple[int, int], goal_coords: Tuple[int, int],
-        visited: Set[Tuple[int, int]], grid_height: int, grid_width: int,
-        previous_coords: Optional[Tuple[int, int]],
+        start_coords: Tuple[int, int], goal_coords: Tuple[int, int],
+        grid_height: int, grid_width: int,
         rng: np.random.Generator) -> Optional[List[Tuple[int, int]]]:
     """Generates a random path through a grid.
 
     For aesthetic reasons, the grid is not allowed to self-intersect.
-    """
-    if curr_coords == goal_coords:
-        return [curr_coords]
-
-    for delta in rng.permutation([[0, 1], [1, 0], [0, -1], [-1, 0]]):
-        new_coord = (curr_coords[0] + delta[0], curr_coords[1] + delta[1])
-        # Out of bounds.
-        if new_coord[0] < 0 or new_coord[0] >= grid_height or new_coord[
-                1] < 0 or new_coord[1] >= grid_width:
-            continue
 
-        # Already visited.
-        if new_coord in visited:
-            continue
-
-        # Prevent visiting coords that are adjacent to visited coords, except
-        # for the most recent predecessor.
-        adjacent_excluding_previous = {
-            (curr_coords[0] + adj_delta[0], curr_coords[1] + adj_delta[1])
-            for adj_delta in [[0, 1], [1, 0], [0, -1], [-1, 0]]
-        } - {previous_coords}
+    This is a depth-first search with backtracking. It uses an explicit
+    stack rather than recursion so that large grids do not run into the
+    recursion limit, and it updates a single set of coords on the path
+    rather than copying the visited set at every step.
+    """
+    assert start_coords != goal_coords
+
+    # The current path, the same coords as a set, and for each coord on the
+    # path, the (randomly ordered) steps that remain to be tried from it.
+    path = [start_coords]
+    on_path = {start_coords}
+    remaining_steps = [iter(rng.permutation(len(_GRID_DELTAS)))]
+
+    while path:
+        curr_coords = path[-1]
+        previous_coords = path[-2] if len(path) > 1 else None
+        next_coords: Optional[Tuple[int, int]] = None
+        # Prevent extending from coords that are adjacent to visited coords,
+        # except for the most recent predecessor. This does not depend on the
+        # next step, so it is checked once rather than for every step.
         adjacent_hit = False
-        for adjacent_coord in adjacent_excluding_previous:
-            if adjacent_coord in visited:
+        for adj_delta in _GRID_DELTAS:
+            adjacent_coord = (curr_coords[0] + adj_delta[0],
+                              curr_coords[1] + adj_delta[1])
+            if adjacent_coord != previous_coords and adjacent_coord in on_path:
                 adjacent_hit = True
-        if adjacent_hit:
-            continue
+                break
+        if not adjacent_hit:
+            for delta_idx in remaining_steps[-1]:
+                delta = _GRID_DELTAS[delta_idx]
+                new_coord = (curr_coords[0] + delta[0],
+                             curr_coords[1] + delta[1])
+                # Out of bounds.
+                if new_coord[0] < 0 or new_coord[0] >= grid_height or \
+                    new_coord[1] < 0 or new_coord[1] >= grid_width:
+                    continue
+
+                # Already visited.
+                if new_coord in on_path:
+                    continue
+
+                # Prevent visiting unreachable coordinates.
+                if not _random_walk_reachable(new_coord, goal_coords, on_path,
+                                              grid_height, grid_width):
+                    continue
+
+                next_coords = new_coord
+                break
 
-        # Prevent visiting unreachable coordinates.
-        if not _random_walk_reachable(new_coord, goal_coords,
-                                      visited | {curr_coords}, grid_height,
-                                      grid_width):
+        if next_coords is None:
+            # All steps from the current coords failed, so backtrack.
+            on_path.remove(path.pop())
+            remaining_steps.pop()
             continue
 
         # Successfully extended the path.
-        grid_walk_from_child = _random_grid_walk(new_coord, goal_coords,
-                                                 visited | {curr_coords},
-                                                 grid_height, grid_width,
-                                                 curr_coords, rng)
-        if grid_walk_from_child is not None:
-            return [curr_coords] + grid_walk_from_child
+        path.append(next_coords)
+        on_path.add(next_coords)
+        if next_coords == goal_coords:
+            return path
+        remaining_steps.append(iter(rng.permutation(len(_GRID_DELTAS))))
 
-    return None
+    # The reachability check prunes dead ends, so the search is not expected
+    # to fail in practice.
+    return None  # pragma: no cover
 
 
 def _random_walk_reachable(curr_coords: Tuple[int,
@@ -406,19 +462,20 @@ def _random_walk_reachable(curr_coords: Tuple[int,
     This is used to rule out bad steps in the random walk that would
     never possibly reach the goal.
     """
-    queue = [(curr_coords, prev_visited.copy())]
-    coord_queue = [curr_coords]
-    visited = prev_visited.copy()
+    if curr_coords == goal_coords:
+        return True
 
-    while len(queue) > 0:
-        curr, curr_visited = queue[0]
-        del queue[0]
-        del coord_queue[0]
+    # Coords in prev_visited are never enqueued, and a coord is not enqueued
+    # again while it is still in the queue. Each entry carries the coords
+    # visited on the way to it. Note that prev_visited is never mutated.
+    queue = deque([(curr_coords, prev_visited)])
+    queued = {curr_coords}
 
-        if curr == goal_coords:
-            return True
+    while queue:
+        curr, curr_visited = queue.popleft()
+        queued.remove(curr)
 
-        for delta in [[0, 1], [1, 0], [0, -1], [-1, 0]]:
+        for delta in _GRID_DELTAS:
             # Out of bounds.
             newC = (curr[0] + delta[0], curr[1] + delta[1])
             if newC[0] < 0 or newC[0] >= grid_height or newC[1] < 0 or newC[
@@ -426,102 +483,73 @@ def _random_walk_reachable(curr_coords: Tuple[int,
                 continue
 
             # Already visited or in queue.
-            if newC in visited or newC in coord_queue:
+            if newC in prev_visited or newC in queued:
                 continue
 
-            # Adjacent to already visited.
-            adjacent_excluding_previous = {
-                (newC[0] + adj_delta[0], newC[1] + adj_delta[1])
-                for adj_delta in [[0, 1], [1, 0], [0, -1], [-1, 0]]
-            } - {curr}
+            # Adjacent to already visited, excluding the previous coords.
             adjacent_hit = False
-            for adjacent_coord in adjacent_excluding_previous:
-                if adjacent_coord in curr_visited:
+            for adj_delta in _GRID_DELTAS:
+                adjacent_coord = (newC[0] + adj_delta[0],
+                                  newC[1] + adj_delta[1])
+                if adjacent_coord != curr and adjacent_coord in curr_visited:
                     adjacent_hit = True
+                    break
             if adjacent_hit:
                 continue
 
+            # Anything that is enqueued is eventually dequeued, so the goal is
+            # reachable as soon as it is enqueued.
+            if newC == goal_coords:
+                return True
+
             queue.append((newC, curr_visited | {curr}))
-            coord_queue.append(newC)
+            queued.add(newC)
 
     return False
 
 
 def _generate_forest_problem(height: int, width: int,
                              rng: np.random.Generator) -> str:
-    grid = np.array(_generate_random_forest_grid(height, width, rng))
+    grid, trail_path = _generate_random_forest_grid(height, width, rng)
 
-    init_strs = set()
+    # Every init atom below is distinct by construction, so collect them in a
+    # list and sort once at the end.
+    init_strs: List[str] = []
     goal_strs = set()
 
     # Create location objects.
-    objects = set()
-    grid_locs = np.empty(grid.shape, dtype=object)
-    for r in range(grid.shape[0]):
-        for c in range(grid.shape[1]):
-            obj = f"r{r}_c{c}"
-            objects.add(obj)
-            grid_locs[r, c] = obj
-
-    # Add at, IsWater, and isHill to init_strs.
-    for r in range(grid.shape[0]):
-        for c in range(grid.shape[1]):
-            obj = grid_locs[r, c]
-            if grid[r, c] == FOREST_I:
-                init_strs.add(f"(at {obj})")
-
-            if grid[r, c] != FOREST_W:
-                init_strs.add(f"(isNotWater {obj})")
-
-            if grid[r, c] == FOREST_H:
-                init_strs.add(f"(isHill {obj})")
-            else:
-                init_strs.add(f"(isNotHill {obj})")
-
-    # Add adjacent to init_strs.
-    def get_neighbors(r: int, c: int) -> Iterator[Tuple[int, int]]:
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr = r + dr
-            nc = c + dc
-            if 0 <= nr < grid.shape[0] and 0 <= nc < grid.shape[1]:
-                yield (nr, nc)
-
-    for r in range(grid.shape[0]):
-        for c in range(grid.shape[1]):
-            obj = grid_locs[r, c]
-            for (nr, nc) in get_neighbors(r, c):
-                nobj = grid_locs[nr, nc]
-                init_strs.add(f"(adjacent {obj} {nobj})")
-
-    # Add onTrail to init_strs.
-
-    # Construct the entire path from the initial location to the goal while
-    # staying on then trail.
-    trail_path = []
-    r, c = np.argwhere(grid == FOREST_I)[0]
-    while True:
-        trail_path.append((r, c))
-        if grid[r, c] == FOREST_G:
-            break
-        for (nr, nc) in get_neighbors(r, c):
-            if (nr, nc) in trail_path:
-                continue
-            if grid[nr, nc] in [FOREST_P, FOREST_G, FOREST_H]:
-                r, c = nr, nc
-                break
-        else:  # pragma: no cover
-            raise Exception("Should not happen")
-
+    grid_locs = np.array([
+        _object_names(f"r{r}_c", grid.shape[1]) for r in range(grid.shape[0])
+    ],
+                         dtype=object)
+    objects = set(grid_locs.flat)
+
+    # Add at, IsWater, and isHill to init_strs. Select the cells for each
+    # atom with a mask over the whole grid rather than branching per cell.
+    init_strs.extend(f"(at {obj})" for obj in grid_locs[grid == FOREST_I])
+    init_strs.extend(f"(isNotWater {obj})"
+                     for obj in grid_locs[grid != FOREST_W])
+    is_hill = grid == FOREST_H
+    init_strs.extend(f"(isHill {obj})" for obj in grid_locs[is_hill])
+    init_strs.extend(f"(isNotHill {obj})" for obj in grid_locs[~is_hill])
+
+    # Add adjacent to init_strs. Horizontally and vertically adjacent cells
+    # are paired up by shifting the grid by one column and one row.
+    for locs, shifted_locs in ((grid_locs[:, :-1], grid_locs[:, 1:]),
+                               (grid_locs[:-1, :], grid_locs[1:, :])):
+        for obj, nobj in zip(locs.flat, shifted_locs.flat):
+            init_strs.append(f"(adjacent {obj} {nobj})")
+            init_strs.append(f"(adjacent {nobj} {obj})")
+
+    # Add onTrail to init_strs. The trail is the random walk that the grid was
+    # built around, from the initial location to the goal.
     for (r, c), (nr, nc) in zip(trail_path[:-1], trail_path[1:]):
         obj = grid_locs[r, c]
         nobj = grid_locs[nr, nc]
-        init_strs.add(f"(onTrail {obj} {nobj})")
+        init_strs.append(f"(onTrail {obj} {nobj})")
 
     # Create goal str.
-    goal_rcs = np.argwhere(grid == FOREST_G)
-    assert len(goal_rcs) == 1
-    goal_r, goal_c = goal_rcs[0]
-    goal_obj = grid_locs[goal_r, goal_c]
+    goal_obj = grid_locs[trail_path[-1]]
     goal_strs.add(f"(at {goal_obj})")
 
     # Finalize PDDL problem str.
@@ -564,9 +592,13 @@ def _generate_gripper_problems(
     rng: np.random.Generator,
 ) -> List[str]:
     problems = []
-    for _ in range(num_problems):
-        num_rooms = rng.integers(min_num_rooms, max_num_rooms + 1)
-        num_balls = rng.integers(min_num_balls, max_num_balls + 1)
+    all_num_rooms = rng.integers(min_num_rooms,
+                                 max_num_rooms + 1,
+                                 size=num_problems)
+    all_num_balls = rng.integers(min_num_balls,
+                                 max_num_balls + 1,
+                                 size=num_problems)
+    for num_rooms, num_balls in zip(all_num_rooms, all_num_balls):
         problem = _generate_gripper_problem(num_rooms, num_balls, prefix, rng)
         problems.append(problem)
     return problems
@@ -579,57 +611,46 @@ def _generate_gripper_problem(
     rng: np.random.Generator,
 ) -> str:
 
-    init_strs = set()
-    goal_strs = set()
+    # Every init atom below is distinct by construction, so collect them in a
+    # list and sort once at the end.
+    init_strs: List[str] = []
+    goal_strs: Set[str] = set()
 
     # Create objects and add typing predicates.
-    room_objects = set()
-    for r in range(num_rooms):
-        obj = f"room{r}"
-        room_objects.add(obj)
-        init_strs.add(f"({prefix}room {obj})")
-
-    ball_objects = set()
-    for ball_id in range(num_balls):
-        obj = f"ball{ball_id}"
-        ball_objects.add(obj)
-        init_strs.add(f"({prefix}ball {obj})")
-
-    gripper_objects = set()
+    room_objects = set(_object_names("room", num_rooms))
+    init_strs.extend(f"({prefix}room {obj})" for obj in room_objects)
+
+    ball_objects = _object_names("ball", num_balls)
+    init_strs.extend(f"({prefix}ball {obj})" for obj in ball_objects)
+
     num_grippers = 2
-    for gripper_id in range(num_grippers):
-        obj = f"gripper{gripper_id}"
-        gripper_objects.add(obj)
-        init_strs.add(f"({prefix}gripper {obj})")
+    gripper_objects = set(_object_names("gripper", num_grippers))
+    init_strs.extend(f"({prefix}gripper {obj})" for obj in gripper_objects)
 
     # Add free and at ground literals
     for gripper_object in gripper_objects:
-        init_strs.add(f"({prefix}free {gripper_object})")
+        init_strs.append(f"({prefix}free {gripper_object})")
 
-    initial_ball_rooms = {}
-    for ball_object in ball_objects:
-        initial_ball_rooms[ball_object] = rng.integers(num_rooms)
-        init_strs.add(
-            f"({prefix}at {ball_object} room{initial_ball_rooms[ball_object]})"
-        )
+    initial_ball_rooms = rng.integers(num_rooms, size=num_balls)
+    init_strs.extend(f"({prefix}at {obj} room{room})"
+                     for obj, room in zip(ball_objects, initial_ball_rooms))
 
     # Always start robby at room0
-    init_strs.add(f"({prefix}at-robby room0)")
+    init_strs.append(f"({prefix}at-robby room0)")
 
     # Create goal str.
     num_goal_balls = rng.integers(1, num_balls + 1)
-    goal_balls = rng.choice(sorted(list(ball_objects)),
-                            size=num_goal_balls,
-                            replace=False)
-    possible_goal_rooms = list(range(num_rooms))
-    for goal_ball in goal_balls:
-        possible_goal_rooms.remove(initial_ball_rooms[goal_ball])
-        goal_room = rng.choice(possible_goal_rooms)
-        goal_strs.add(f"({prefix}at {goal_ball} room{goal_room})")
-        possible_goal_rooms.append(initial_ball_rooms[goal_ball])
+    goal_ball_idxs = rng.permutation(num_balls)[:num_goal_balls]
+    # Sample uniformly from the rooms other than the initial one, by skipping
+    # past the initial room.
+    goal_rooms = rng.integers(num_rooms - 1, size=num_goal_balls)
+    goal_rooms += goal_rooms >= initial_ball_rooms[goal_ball_idxs]
+    goal_strs.update(
+        f"({prefix}at {ball_objects[ball_idx]} room{goal_room})"
+        for ball_idx, goal_room in zip(goal_ball_idxs, goal_rooms))
 
     # Finalize PDDL problem str.
-    all_objects = room_objects | ball_objects | gripper_objects
+    all_objects = room_objects | set(ball_objects) | gripper_objects
     objects_str = "\n        ".join(all_objects)
     init_str = " ".join(sorted(init_strs))
     goal_str = " ".join(sorted(goal_strs))
@@ -663,9 +684,9 @@ def _generate_ferry_problems(
     rng: np.random.Generator,
 ) -> List[str]:
     problems = []
-    for _ in range(num_problems):
-        num_locs = rng.integers(min_locs, max_locs + 1)
-        num_cars = rng.integers(min_cars, max_cars + 1)
+    all_num_locs = rng.integers(min_locs, max_locs + 1, size=num_problems)
+    all_num_cars = rng.integers(min_cars, max_cars + 1, size=num_problems)
+    for num_locs, num_cars in zip(all_num_locs, all_num_cars):
         problem = _generate_ferry_problem(num_locs, num_cars, rng)
         problems.append(problem)
     return problems
@@ -677,46 +698,41 @@ def _generate_ferry_problem(
     rng: np.random.Generator,
 ) -> str:
 
-    init_strs = set()
-    goal_strs = set()
+    # Every init atom below is distinct by construction, so collect them in a
+    # list and sort once at the end.
+    init_strs: List[str] = []
+    goal_strs: Set[str] = set()
 
     # Create objects and add typing predicates.
-    loc_objects = []
-    for i in range(num_locs):
-        obj = f"l{i}"
-        loc_objects.append(obj)
-        init_strs.add(f"(location {obj})")
-    car_objects = []
-    for i in range(num_cars):
-        obj = f"c{i}"
-        car_objects.append(obj)
-        init_strs.add(f"(car {obj})")
+    loc_objects = _object_names("l", num_locs)
+    init_strs.extend(f"(location {obj})" for obj in loc_objects)
+    car_objects = _object_names("c", num_cars)
+    init_strs.extend(f"(car {obj})" for obj in car_objects)
 
     # Add not-eq predicates for locations.
-    for loc1 in loc_objects:
-        for loc2 in loc_objects:
-            if loc1 != loc2:
-                init_strs.add(f"(not-eq {loc1} {loc2})")
+    init_strs.extend(f"(not-eq {loc1} {loc2})"
+                     for loc1, loc2 in itertools.permutations(loc_objects, 2))
 
     # Add empty-ferry predicate.
-    init_strs.add("(empty-ferry)")
+    init_strs.append("(empty-ferry)")
 
     # Create car origins and destinations.
-    for i, car in enumerate(car_objects):
-        car_origin = rng.choice(loc_objects)
-        init_strs.add(f"(at {car} {car_origin})")
-        # Prevent trivial problems by forcing the first origin and dest to
-        # differ.
-        if i == 0:
-            remaining_locs = [l for l in loc_objects if l != car_origin]
-        else:
-            remaining_locs = loc_objects
-        car_dest = rng.choice(remaining_locs)
-        goal_strs.add(f"(at {car} {car_dest})")
+    car_origins = rng.integers(num_locs, size=num_cars)
+    # Prevent trivial problems by forcing the first origin and dest to
+    # differ. The first dest is drawn from one fewer location and then
+    # shifted past the origin.
+    dest_highs = np.full(num_cars, num_locs)
+    dest_highs[:1] -= 1
+    car_dests = rng.integers(dest_highs)
+    car_dests[:1] += car_dests[:1] >= car_origins[:1]
+    init_strs.extend(f"(at {car} {loc_objects[origin]})"
+                     for car, origin in zip(car_objects, car_origins))
+    goal_strs.update(f"(at {car} {loc_objects[dest]})"
+                     for car, dest in zip(car_objects, car_dests))
 
     # Create the ferry origin.
-    ferry_origin = rng.choice(loc_objects)
-    init_strs.add(f"(at-ferry {ferry_origin})")
+    ferry_origin = loc_objects[rng.integers(num_locs)]
+    init_strs.append(f"(at-ferry {ferry_origin})")
 
     # Finalize PDDL problem str.
     all_objects = car_objects + loc_objects
@@ -763,11 +779,17 @@ def _generate_miconic_problems(
     rng: np.random.Generator,
 ) -> List[str]:
     problems = []
-    for _ in range(num_problems):
-        num_buildings = rng.integers(min_num_buildings, max_num_buildings + 1)
-        num_floors = rng.integers(min_num_floors, max_num_floors + 1)
-        num_passengers = rng.integers(min_num_passengers,
-                                      max_num_passengers + 1)
+    all_num_buildings = rng.integers(min_num_buildings,
+                                     max_num_buildings + 1,
+                                     size=num_problems)
+    all_num_floors = rng.integers(min_num_floors,
+                                  max_num_floors + 1,
+                                  size=num_problems)
+    all_num_passengers = rng.integers(min_num_passengers,
+                                      max_num_passengers + 1,
+                                      size=num_problems)
+    for num_buildings, num_floors, num_passengers in zip(
+            all_num_buildings, all_num_floors, all_num_passengers):
         problem = _generate_miconic_problem(num_buildings, num_floors,
                                             num_passengers, rng)
         problems.append(problem)
@@ -781,47 +803,52 @@ def _generate_miconic_problem(
     rng: np.random.Generator,
 ) -> str:
 
-    init_strs = set()
+    # Every init atom below is distinct by construction, so collect them in a
+    # list and sort once at the end.
+    init_strs: List[str] = []
     goal_strs = set()
 
     # Create floors and passengers per building.
     buildings = list(range(num_buildings))
-    building_to_floors: Dict[int, List[str]] = {b: [] for b in buildings}
-    building_to_passengers: Dict[int, List[str]] = {b: [] for b in buildings}
-    for b in buildings:
-        # Create floors.
-        for i in range(num_floors):
-            floor = f"f{i}_b{b}"
-            building_to_floors[b].append(floor)
-        # Create passengers.
-        for i in range(num_passengers):
-            passenger = f"p{i}_b{b}"
-            building_to_passengers[b].append(passenger)
+    building_to_floors: Dict[int, Tuple[str, ...]] = {
+        b: _object_names("f", num_floors, f"_b{b}")
+        for b in buildings
+    }
+    building_to_passengers: Dict[int, Tuple[str, ...]] = {
+        b: _object_names("p", num_passengers, f"_b{b}")
+        for b in buildings
+    }
 
     # Create above atoms.
     for b in buildings:
-        building_floors = building_to_floors[b]
-        for i, below_floor in enumerate(building_floors[:-1]):
-            for above_floor in building_floors[i + 1:]:
-                init_strs.add(f"(above {below_floor} {above_floor})")
+        init_strs.extend(f"(above {below_floor} {above_floor})"
+                         for below_floor, above_floor in
+                         itertools.combinations(building_to_floors[b], 2))
 
     # Create origin and destination atoms.
+    # Origins are distinct, and each destination differs from the origins of
+    # that passenger and all earlier ones. After the first i + 1 origins are
+    # taken from a permutation, the rest of the permutation is exactly the
+    # floors that passenger i may go to, so sample destinations from there.
+    passenger_idxs = np.arange(num_passengers)
     for b in buildings:
-        building_passengers = building_to_passengers[b]
-        free_floors = list(building_to_floors[b])
-        for passenger in building_passengers:
-            # Only allow one passenger origin or destination per floor.
-            origin = rng.choice(free_floors)
-            free_floors.remove(origin)
-            destination = rng.choice(free_floors)
-            init_strs.add(f"(origin {passenger} {origin})")
-            init_strs.add(f"(destin {passenger} {destination})")
+        building_floors = building_to_floors[b]
+        floor_perm = rng.permutation(num_floors)
+        dest_offsets = rng.integers(num_floors - 1 - passenger_idxs)
+        dest_perm_idxs = passenger_idxs + 1 + dest_offsets
+        for passenger, origin_idx, dest_idx in zip(building_to_passengers[b],
+                                                   floor_perm,
+                                                   floor_perm[dest_perm_idxs]):
+            init_strs.append(
+                f"(origin {passenger} {building_floors[origin_idx]})")
+            init_strs.append(
+                f"(destin {passenger} {building_floors[dest_idx]})")
 
     # Create lift origins.
     for b in buildings:
         building_floors = building_to_floors[b]
-        lift_origin = rng.choice(building_floors)
-        init_strs.add(f"(lift-at {lift_origin})")
+        lift_origin = building_floors[rng.integers(num_floors)]
+        init_strs.append(f"(lift-at {lift_origin})")
 
     # Create goal atoms.
     for b in buildings:
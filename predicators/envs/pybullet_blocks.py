@@ -29,8 +29,17 @@ class PyBulletBlocksEnv(PyBulletEnv, BlocksEnv):
         super().__init__(use_gui)
 
         # We track the correspondence between PyBullet object IDs and Object
-        # instances for blocks. This correspondence changes with the task.
+        # instances for blocks, in both directions. This correspondence
+        # changes with the task.
         self._block_id_to_block: Dict[int, Object] = {}
+        self._block_to_block_id: Dict[Object, int] = {}
+        # Sorted block IDs, for the held check.
+        self._sorted_block_ids: List[int] = []
+        # The RGBA color last set on each block body. Block colors only change
+        # in _reset_state(), so this lets resets skip redundant color changes
+        # and lets _get_state() avoid querying the visual shape data.
+        self._block_id_to_rgba: Dict[int, Tuple[float, float, float,
+                                                float]] = {}
 
     @classmethod
     def initialize_pybullet(
@@ -141,61 +150,88 @@ class PyBulletBlocksEnv(PyBulletEnv, BlocksEnv):
         """Run super(), then handle blocks-specific resetting."""
         super()._reset_state(state)
 
-        # Reset blocks based on the state.
-        block_objs = state.get_objects(self._block_type)
-        self._block_id_to_block = {}
-        for i, block_obj in enumerate(block_objs):
-            block_id = self._block_ids[i]
-            self._block_id_to_block[block_id] = block_obj
-            bx = state.get(block_obj, "pose_x")
-            by = state.get(block_obj, "pose_y")
-            bz = state.get(block_obj, "pose_z")
-            p.resetBasePositionAndOrientation(
-                block_id, [bx, by, bz],
-                self._default_orn,
-                physicsClientId=self._physics_client_id)
-            # Update the block color. RGB values are between 0 and 1.
-            r = state.get(block_obj, "color_r")
-            g = state.get(block_obj, "color_g")
-            b = state.get(block_obj, "color_b")
-            color = (r, g, b, 1.0)  # alpha = 1.0
-            p.changeVisualShape(block_id,
-                                linkIndex=-1,
-                                rgbaColor=color,
-                                physicsClientId=self._physics_client_id)
-
-        # Check if we're holding some block.
-        held_block = self._get_held_block(state)
-        if held_block is not None:
-            self._force_grasp_object(held_block)
-
-        # For any blocks not involved, put them out of view.
-        h = self._block_size
-        oov_x, oov_y = self._out_of_view_xy
-        for i in range(len(block_objs), len(self._block_ids)):
-            block_id = self._block_ids[i]
-            assert block_id not in self._block_id_to_block
-            p.resetBasePositionAndOrientation(
-                block_id, [oov_x, oov_y, i * h],
-                self._default_orn,
-                physicsClientId=self._physics_client_id)
+        # Pause GUI rendering while the bodies are updated, rather than
+        # redrawing after every individual change.
+        if self.using_gui:  # pragma: no cover
+            p.configureDebugVisualizer(p.COV_ENABLE_RENDERING,
+                                       False,
+                                       physicsClientId=self._physics_client_id)
+
+        # Re-enable rendering even if an update below fails.
+        try:
+            # These are used for every block below, so look them up only once.
+            physics_client_id = self._physics_client_id
+            default_orn = self._default_orn
+            reset_pose = p.resetBasePositionAndOrientation
+            change_visual_shape = p.changeVisualShape
+
+            # Reset blocks based on the state.
+            block_objs = state.get_objects(self._block_type)
+            self._block_id_to_block = {}
+            self._block_to_block_id = {}
+            for i, block_obj in enumerate(block_objs):
+                block_id = self._block_ids[i]
+                self._block_id_to_block[block_id] = block_obj
+                self._block_to_block_id[block_obj] = block_id
+                bx = state.get(block_obj, "pose_x")
+                by = state.get(block_obj, "pose_y")
+                bz = state.get(block_obj, "pose_z")
+                reset_pose(block_id, [bx, by, bz],
+                           default_orn,
+                           physicsClientId=physics_client_id)
+                # Update the block color. RGB values are between 0 and 1.
+                r = state.get(block_obj, "color_r")
+                g = state.get(block_obj, "color_g")
+                b = state.get(block_obj, "color_b")
+                color = (r, g, b, 1.0)  # alpha = 1.0
+                if self._block_id_to_rgba.get(block_id) != color:
+                    change_visual_shape(block_id,
+                                        linkIndex=-1,
+                                        rgbaColor=color,
+                                        physicsClientId=physics_client_id)
+                    self._block_id_to_rgba[block_id] = color
+
+            self._sorted_block_ids = sorted(self._block_id_to_block)
+
+            # Check if we're holding some block.
+            held_block = self._get_held_block(state)
+            if held_block is not None:
+                self._force_grasp_object(held_block)
+
+            # For any blocks not involved, put them out of view.
+            h = self._block_size
+            oov_x, oov_y = self._out_of_view_xy
+            for i in range(len(block_objs), len(self._block_ids)):
+                block_id = self._block_ids[i]
+                assert block_id not in self._block_id_to_block
+                reset_pose(block_id, [oov_x, oov_y, i * h],
+                           default_orn,
+                           physicsClientId=physics_client_id)
+        finally:
+            if self.using_gui:  # pragma: no cover
+                p.configureDebugVisualizer(
+                    p.COV_ENABLE_RENDERING,
+                    True,
+                    physicsClientId=self._physics_client_id)
 
         # Assert that the state was properly reconstructed.
-        reconstructed_state = self._get_state()
-        if not reconstructed_state.allclose(state):
-            logging.debug("Desired state:")
-            logging.debug(state.pretty_str())
-            logging.debug("Reconstructed state:")
-            logging.debug(reconstructed_state.pretty_str())
-            raise ValueError("Could not reconstruct state.")
+        if CFG.pybullet_blocks_check_reset_state:
+            reconstructed_state = self._get_state()
+            if not reconstructed_state.allclose(state):
+                logging.debug("Desired state:")
+                logging.debug(state.pretty_str())
+                logging.debug("Reconstructed state:")
+                logging.debug(reconstructed_state.pretty_str())
+                raise ValueError("Could not reconstruct state.")
 
     def _get_state(self) -> State:
         """Create a State based on the current PyBullet state.
 
         Note that in addition to the state inside PyBullet itself, this
-        uses self._block_id_to_block and self._held_obj_id. As long as
-        the PyBullet internal state is only modified through reset() and
-        step(), these all should remain in sync.
+        uses self._block_id_to_block, self._block_id_to_rgba, and
+        self._held_obj_id. As long as the PyBullet internal state is
+        only modified through reset() and step(), these all should
+        remain in sync.
         """
         state_dict = {}
 
@@ -206,14 +242,17 @@ class PyBulletBlocksEnv(PyBulletEnv, BlocksEnv):
                                            dtype=np.float32)
         joint_positions = self._pybullet_robot.get_joints()
 
-        # Get block states.
+        # Get block states. Block colors come from the cache set in
+        # _reset_state(), so only the poses need to be queried.
+        physics_client_id = self._physics_client_id
+        held_obj_id = self._held_obj_id
+        block_id_to_rgba = self._block_id_to_rgba
+        get_pose = p.getBasePositionAndOrientation
         for block_id, block in self._block_id_to_block.items():
-            (bx, by, bz), _ = p.getBasePositionAndOrientation(
-                block_id, physicsClientId=self._physics_client_id)
-            held = (block_id == self._held_obj_id)
-            visual_data = p.getVisualShapeData(
-                block_id, physicsClientId=self._physics_client_id)[0]
-            r, g, b, _ = visual_data[7]
+            (bx, by, bz), _ = get_pose(block_id,
+                                       physicsClientId=physics_client_id)
+            held = (block_id == held_obj_id)
+            r, g, b, _ = block_id_to_rgba[block_id]
             # pose_x, pose_y, pose_z, held
             state_dict[block] = np.array([bx, by, bz, held, r, g, b],
                                          dtype=np.float32)
@@ -236,7 +275,7 @@ class PyBulletBlocksEnv(PyBulletEnv, BlocksEnv):
         return self._add_pybullet_state_to_tasks([task])[0]
 
     def _get_object_ids_for_held_check(self) -> List[int]:
-        return sorted(self._block_id_to_block)
+        return self._sorted_block_ids
 
     def _get_expected_finger_normals(self) -> Dict[int, Array]:
         if CFG.pybullet_robot == "panda":
@@ -255,8 +294,7 @@ class PyBulletBlocksEnv(PyBulletEnv, BlocksEnv):
         }
 
     def _force_grasp_object(self, block: Object) -> None:
-        block_to_block_id = {b: i for i, b in self._block_id_to_block.items()}
-        block_id = block_to_block_id[block]
+        block_id = self._block_to_block_id[block]
         # The block should already be held. Otherwise, the position of the
         # block was wrong in the state.
         held_obj_id = self._detect_held_object()
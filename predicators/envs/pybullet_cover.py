@@ -103,6 +103,12 @@ class PyBulletCoverEnv(PyBulletEnv, CoverEnv):
         self._table_id = pybullet_bodies["table_id"]
         self._block_ids = pybullet_bodies["block_ids"]
         self._target_ids = pybullet_bodies["target_ids"]
+        # Object widths never change, so only query them from PyBullet once.
+        self._obj_id_to_width_unnorm: Dict[int, float] = {
+            obj_id: p.getVisualShapeData(
+                obj_id, physicsClientId=self._physics_client_id)[0][3][1]
+            for obj_id in self._block_ids + self._target_ids
+        }
 
     @classmethod
     def _create_pybullet_robot(
@@ -139,8 +145,7 @@ class PyBulletCoverEnv(PyBulletEnv, CoverEnv):
         self._block_id_to_block = {}
         for i, block_obj in enumerate(block_objs):
             block_id = self._block_ids[i]
-            width_unnorm = p.getVisualShapeData(
-                block_id, physicsClientId=self._physics_client_id)[0][3][1]
+            width_unnorm = self._obj_id_to_width_unnorm[block_id]
             width = width_unnorm / self._max_obj_width * max_width
             assert width == state.get(block_obj, "width")
             self._block_id_to_block[block_id] = block_obj
@@ -179,8 +184,7 @@ class PyBulletCoverEnv(PyBulletEnv, CoverEnv):
         self._target_id_to_target = {}
         for i, target_obj in enumerate(target_objs):
             target_id = self._target_ids[i]
-            width_unnorm = p.getVisualShapeData(
-                target_id, physicsClientId=self._physics_client_id)[0][3][1]
+            width_unnorm = self._obj_id_to_width_unnorm[target_id]
             width = width_unnorm / self._max_obj_width * max_width
             assert width == state.get(target_obj, "width")
             self._target_id_to_target[target_id] = target_obj
@@ -247,8 +251,7 @@ class PyBulletCoverEnv(PyBulletEnv, CoverEnv):
 
         # Get block states.
         for block_id, block in self._block_id_to_block.items():
-            width_unnorm = p.getVisualShapeData(
-                block_id, physicsClientId=self._physics_client_id)[0][3][1]
+            width_unnorm = self._obj_id_to_width_unnorm[block_id]
             width = width_unnorm / self._max_obj_width * max_width
             (_, by, _), _ = p.getBasePositionAndOrientation(
                 block_id, physicsClientId=self._physics_client_id)
@@ -266,8 +269,7 @@ class PyBulletCoverEnv(PyBulletEnv, CoverEnv):
 
         # Get target states.
         for target_id, target in self._target_id_to_target.items():
-            width_unnorm = p.getVisualShapeData(
-                target_id, physicsClientId=self._physics_client_id)[0][3][1]
+            width_unnorm = self._obj_id_to_width_unnorm[target_id]
             width = width_unnorm / self._max_obj_width * max_width
             (_, ty, _), _ = p.getBasePositionAndOrientation(
                 target_id, physicsClientId=self._physics_client_id)
@@ -15,6 +15,7 @@ from predicators import utils
 from predicators.envs import BaseEnv
 from predicators.pybullet_helpers.camera import create_gui_connection
 from predicators.pybullet_helpers.geometry import Pose3D, Quaternion
+from predicators.pybullet_helpers.joint import JointPositions
 from predicators.pybullet_helpers.link import get_link_state
 from predicators.pybullet_helpers.robots import SingleArmPyBulletRobot
 from predicators.settings import CFG
@@ -388,12 +389,20 @@ class PyBulletEnv(BaseEnv):
             self, tasks: List[EnvironmentTask]) -> List[EnvironmentTask]:
         """Converts the task initial states into PyBulletStates."""
         pybullet_tasks = []
+        # Tasks often share the same initial robot state, and resetting the
+        # robot runs inverse kinematics from the same initial joints each time,
+        # so only do that once per distinct robot state.
+        robot_state_to_joints: Dict[Tuple[float, ...], JointPositions] = {}
         for task in tasks:
-            # Reset the robot.
             init = task.init
-            self._pybullet_robot.reset_state(self._extract_robot_state(init))
-            # Extract the joints.
-            joint_positions = self._pybullet_robot.get_joints()
+            robot_state = self._extract_robot_state(init)
+            key = tuple(robot_state.tolist())
+            if key not in robot_state_to_joints:
+                # Reset the robot.
+                self._pybullet_robot.reset_state(robot_state)
+                # Extract the joints.
+                robot_state_to_joints[key] = self._pybullet_robot.get_joints()
+            joint_positions = list(robot_state_to_joints[key])
             pybullet_init = utils.PyBulletState(
                 init.data.copy(), simulator_state=joint_positions)
             pybullet_task = EnvironmentTask(pybullet_init, task.goal)
@@ -746,11 +746,13 @@ class SandwichEnv(BaseEnv):
         # Finally, we wouldn't want to use the object names to determine their
         # ingredient type because all predicates must be a function of the
         # object states, and the object names are not part of the states.
-        obj_color = (state.get(obj, "color_r"), state.get(obj, "color_g"),
-                     state.get(obj, "color_b"))
+        r = float(state.get(obj, "color_r"))
+        g = float(state.get(obj, "color_g"))
+        b = float(state.get(obj, "color_b"))
+        # Plain float arithmetic is much faster than numpy for 3-vectors.
         affinities = {
-            n: np.sum(np.subtract(c, obj_color)**2)
-            for n, c in self.ingredient_colors.items()
+            n: (cr - r)**2 + (cg - g)**2 + (cb - b)**2
+            for n, (cr, cg, cb) in self.ingredient_colors.items()
         }
         closest = min(affinities, key=lambda o: affinities[o])
         return closest
@@ -1092,6 +1092,16 @@ class MonotonicBetaRegressor(PyTorchRegressor, DistributionRegressor):
         mean = self._predict(np.array([x], dtype=np.float32))[0]
         return utils.beta_from_mean_and_variance(mean, self.variance)
 
+    def predict_means(self, xs: Array) -> Array:
+        """Predict the beta means for a 1D array of inputs.
+
+        Faster than predict_beta() when only the means are needed, since
+        all inputs are evaluated in one forward pass and no BetaRV is
+        instantiated.
+        """
+        assert xs.ndim == 1
+        return self._predict(xs)
+
     def predict_sample(self, x: Array, rng: np.random.Generator) -> Array:
         assert len(x) == 1
         rv = self.predict_beta(x[0])
@@ -80,6 +80,9 @@ class GlobalSettings:
     blocks_num_blocks_test = [5, 6]
     blocks_holding_goals = False
     blocks_block_size = 0.045  # use 0.0505 for real with panda
+    # set to False to skip the reconstruction check after pybullet_blocks
+    # resets
+    pybullet_blocks_check_reset_state = True
 
     # playroom env parameters
     playroom_num_blocks_train = [3]
@@ -33,6 +33,24 @@ class Type:
         """Dimensionality of the feature vector of this object type."""
         return len(self.feature_names)
 
+    @cached_property
+    def _feature_name_to_idx(self) -> Dict[str, int]:
+        feature_name_to_idx: Dict[str, int] = {}
+        for idx, feature_name in enumerate(self.feature_names):
+            feature_name_to_idx.setdefault(feature_name, idx)
+        return feature_name_to_idx
+
+    def get_feature_idx(self, feature_name: str) -> int:
+        """Index of the named feature in the feature vector of this type.
+
+        Raises a ValueError if there is no such feature.
+        """
+        try:
+            return self._feature_name_to_idx[feature_name]
+        except KeyError:
+            raise ValueError(f"{feature_name} is not a feature of type "
+                             f"{self.name}") from None
+
     def get_ancestors(self) -> Set[Type]:
         """Get the set of all types that are ancestors (i.e. parents,
         grandparents, great-grandparents, etc.) of the current type."""
@@ -138,12 +156,12 @@ class State:
 
     def get(self, obj: Object, feature_name: str) -> Any:
         """Look up an object feature by name."""
-        idx = obj.type.feature_names.index(feature_name)
+        idx = obj.type.get_feature_idx(feature_name)
         return self.data[obj][idx]
 
     def set(self, obj: Object, feature_name: str, feature_val: Any) -> None:
         """Set the value of an object feature by name."""
-        idx = obj.type.feature_names.index(feature_name)
+        idx = obj.type.get_feature_idx(feature_name)
         self.data[obj][idx] = feature_val
 
     def get_objects(self, object_type: Type) -> List[Object]:
@@ -189,12 +207,23 @@ class State:
                                           "simulator_state is not None.")
             if self.simulator_state != other.simulator_state:
                 return False
-        if not sorted(self.data) == sorted(other.data):
+        if self.data.keys() != other.data.keys():
             return False
-        for obj in self.data:
-            if not np.allclose(self.data[obj], other.data[obj], atol=1e-3):
-                return False
-        return True
+        if not self.data:
+            return True
+        objs = list(self.data)
+        # Objects may have different numbers of features, so the shapes must
+        # match per object for the concatenated features below to line up.
+        if any(
+                np.shape(self.data[o]) != np.shape(other.data[o])
+                for o in objs):
+            return False
+        # Compare all features at once, which is much faster than calling
+        # np.allclose once per object.
+        return np.allclose(
+            np.concatenate([np.ravel(self.data[o]) for o in objs]),
+            np.concatenate([np.ravel(other.data[o]) for o in objs]),
+            atol=1e-3)
 
     def pretty_str(self) -> str:
         """Display the state in a nice human-readable format."""
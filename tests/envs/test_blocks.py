@@ -12,6 +12,7 @@ import predicators.pretrained_model_interface
 from predicators import utils
 from predicators.envs.blocks import BlocksEnv, BlocksEnvClear
 from predicators.ground_truth_models import get_gt_options
+from predicators.settings import CFG
 
 _ENV_MODULE_PATH = predicators.envs.blocks.__name__
 _LLM_MODULE_PATH = predicators.pretrained_model_interface.__name__
@@ -153,6 +154,28 @@ def test_blocks_clear():
     assert not clear(block1, state)
 
 
+def test_blocks_on_tolerance():
+    """Tests that On matches np.allclose at the tolerance boundary."""
+    utils.reset_config({"env": "blocks"})
+    env = BlocksEnv()
+    On = [p for p in env.predicates if p.name == "On"][0]
+    block_type = [t for t in env.types if t.name == "block"][0]
+    state = env.get_train_tasks()[0].init.copy()
+    block1, block2 = state.get_objects(block_type)[:2]
+    x2 = state.get(block2, "pose_x")
+    state.set(block1, "pose_y", state.get(block2, "pose_y"))
+    state.set(block1, "pose_z",
+              state.get(block2, "pose_z") + CFG.blocks_block_size)
+    state.set(block1, "held", 0.0)
+    state.set(block2, "held", 0.0)
+    # Just outside on_tol, but inside the relative tolerance that
+    # np.allclose adds on top of it.
+    for dx in [env.on_tol + 0.5e-5 * abs(x2), env.on_tol + 2e-5 * abs(x2)]:
+        state.set(block1, "pose_x", x2 + dx)
+        expected = np.allclose(x2 + dx, x2, atol=env.on_tol)
+        assert On.holds(state, [block1, block2]) == expected
+
+
 def test_blocks_load_task_from_json():
     """Tests for loading blocks test tasks from a JSON file."""
     # Set up the JSON file.
@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+import pybullet as p
 import pytest
 from gym.spaces import Box
 
@@ -13,7 +14,7 @@ from predicators import utils
 from predicators.envs.pybullet_blocks import PyBulletBlocksEnv
 from predicators.ground_truth_models import get_gt_options
 from predicators.settings import CFG
-from predicators.structs import Object, ParameterizedOption, State
+from predicators.structs import Action, Object, ParameterizedOption, State
 
 _GUI_ON = False  # toggle for debugging
 
@@ -30,6 +31,22 @@ class _ExposedPyBulletBlocksEnv(PyBulletBlocksEnv):
         """Expose the block size."""
         return self._block_size
 
+    @property
+    def block_ids(self):
+        """Expose the PyBullet block IDs."""
+        return self._block_ids
+
+    @property
+    def out_of_view_xy(self):
+        """Expose the x, y position where unused blocks are parked."""
+        return self._out_of_view_xy
+
+    def get_block_position(self, block_id):
+        """Get the current position of a block body in PyBullet."""
+        position, _ = p.getBasePositionAndOrientation(
+            block_id, physicsClientId=self._physics_client_id)
+        return position
+
     @property
     def robot(self):
         """Expose the robot, which is a static object."""
@@ -131,6 +148,10 @@ def test_pybullet_blocks_reset(env):
     with pytest.raises(ValueError) as e:
         env.set_state(state)
     assert "Could not reconstruct state." in str(e)
+    # The reconstruction check can be disabled.
+    utils.update_config({"pybullet_blocks_check_reset_state": False})
+    env.set_state(state)
+    utils.update_config({"pybullet_blocks_check_reset_state": True})
     # Render state should not work.
     action = env.action_space.sample()
     task = env.get_train_tasks()[0]
@@ -150,6 +171,41 @@ def test_pybullet_blocks_reset(env):
     assert recovered_state.get(block, "held") > 0.5
 
 
+def test_pybullet_blocks_reset_parks_unused_blocks(env):
+    """Tests that blocks not in the task are parked out of view on every reset,
+    even after the simulation has moved them."""
+    task_idx, task = min(
+        enumerate(env.get_train_tasks()),
+        key=lambda t: len(t[1].init.get_objects(env.block_type)))
+    num_blocks = len(task.init.get_objects(env.block_type))
+    unused_block_ids = env.block_ids[num_blocks:]
+    assert unused_block_ids
+    oov_x, oov_y = env.out_of_view_xy
+
+    def _assert_parked():
+        for i, block_id in enumerate(env.block_ids):
+            if i < num_blocks:
+                continue
+            expected = (oov_x, oov_y, i * env.block_size)
+            assert np.allclose(env.get_block_position(block_id), expected)
+
+    state = env.reset("train", task_idx)
+    _assert_parked()
+    # Stepping the physics lets the parked blocks fall under gravity. The
+    # "reset" control mode used in these tests does not step the physics.
+    utils.update_config({"pybullet_control_mode": "position"})
+    action = Action(np.array(state.joint_positions, dtype=np.float32))
+    for _ in range(10):
+        env.step(action)
+    utils.update_config({"pybullet_control_mode": "reset"})
+    assert all(
+        env.get_block_position(block_id)[2] < 0
+        for block_id in unused_block_ids)
+    # Resetting should put them back.
+    env.reset("train", task_idx)
+    _assert_parked()
+
+
 def test_pybullet_blocks_picking(env):
     """Tests for picking blocks in PyBulletBlocksEnv."""
     block = Object("block0", env.block_type)
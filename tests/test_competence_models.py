@@ -1,5 +1,7 @@
 """Tests for competence_models.py."""
 
+import pickle
+
 import numpy as np
 import pytest
 
@@ -73,6 +75,35 @@ def test_latent_variable_skill_competence_model_short():
     assert model.predict_competence(1) > model.get_current_competence()
     model.observe(True)
     assert model.get_current_competence() > 0.5
+    # The regressor inputs are the number of data before each cycle.
+    inputs = model._get_regressor_inputs()  # pylint: disable=protected-access
+    assert np.allclose(inputs, [[0.0], [2.0]])
+    assert model._get_current_num_data() == 3  # pylint: disable=protected-access
+    # Models pickled before the regressor inputs were stored should rebuild
+    # them when loaded.
+    del model._num_data_before_cycle  # pylint: disable=protected-access
+    model = pickle.loads(pickle.dumps(model))
+    inputs = model._get_regressor_inputs()  # pylint: disable=protected-access
+    assert np.allclose(inputs, [[0.0], [2.0]])
+    assert model._get_current_num_data() == 3  # pylint: disable=protected-access
+    model.advance_cycle()
+    inputs = model._get_regressor_inputs()  # pylint: disable=protected-access
+    assert np.allclose(inputs, [[0.0], [2.0], [3.0]])
+    # Advancing a cycle without any outcomes should not learn a regressor.
+    model = create_competence_model("latent_variable", "test")
+    model.advance_cycle()
+    assert model._competence_regressor is None  # pylint: disable=protected-access
+    assert np.isclose(model.get_current_competence(), 0.5)
+    assert np.isclose(model.predict_competence(1),
+                      0.5 + CFG.skill_competence_initial_prediction_bonus)
+    # Empty cycles before non-empty ones contribute the prior mean.
+    model.observe(True)
+    model.advance_cycle()
+    assert model._competence_regressor is not None  # pylint: disable=protected-access
+    assert model.get_current_competence() > 0.5
+    current_competence = model.get_current_competence()
+    model.advance_cycle()
+    assert np.isclose(model.get_current_competence(), current_competence)
 
 
 def test_optimistic_skill_competence_model():
@@ -203,6 +203,11 @@ def test_monotonic_beta_regressor():
     sample = model.predict_sample(x, rng)
     assert sample.shape == expected_y.shape
     assert 0 < sample[0] < 1
+    xs = np.array([0, num_samples - 1], dtype=np.float32)
+    means = model.predict_means(xs)
+    assert means.shape == (2, )
+    assert np.isclose(means[0], model.predict_beta(0).mean())
+    assert np.isclose(means[1], mean[0])
 
 
 def test_mlp_classifier():
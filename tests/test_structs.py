@@ -23,6 +23,10 @@ def test_object_type():
     assert my_type.dim == len(my_type.feature_names) == len(feats)
     assert my_type.feature_names == feats
     assert isinstance(hash(my_type), int)
+    assert my_type.get_feature_idx("feat1") == 0
+    assert my_type.get_feature_idx("feat2") == 1
+    with pytest.raises(ValueError):
+        my_type.get_feature_idx("feat3")
     name = "test2"
     feats = ["feat3"]
     my_type2 = Type(name, feats, parent=my_type)
@@ -166,6 +170,16 @@ def test_state():
         obj9: [11, 12, 13]
     })
     assert not state.allclose(state2)  # obj2 is extra
+    misaligned_state = state.copy()
+    misaligned_state.data[obj3] = [1, 122, 3]
+    misaligned_state.data[obj7] = [4]
+    # The concatenated features are the same, but obj3 and obj7 differ.
+    objs = list(state.data)
+    assert np.concatenate([state[o] for o in objs]).tolist() == \
+        np.concatenate([misaligned_state[o] for o in objs]).tolist()
+    assert not state.allclose(misaligned_state)
+    assert not misaligned_state.allclose(state)
+    assert State({}).allclose(State({}))
     # Test pretty_str
     assert state2.pretty_str() == """################# STATE ################
 type: type1      feat1    feat2
@@ -2519,26 +2519,25 @@ def test_create_pddl():
     location0 - location
     location1 - location
     location2 - location
+    location3 - location
     nut0 - nut
     shed - location
     spanner0 - spanner
     spanner1 - spanner
-    spanner2 - spanner
   )
   (:init
     (at bob shed)
     (at nut0 gate)
-    (at spanner0 location0)
-    (at spanner1 location2)
-    (at spanner2 location0)
+    (at spanner0 location3)
+    (at spanner1 location1)
     (link location0 location1)
     (link location1 location2)
-    (link location2 gate)
+    (link location2 location3)
+    (link location3 gate)
     (link shed location0)
     (loose nut0)
     (useable spanner0)
     (useable spanner1)
-    (useable spanner2)
   )
   (:goal (and (tightened nut0)))
 )